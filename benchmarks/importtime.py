@@ -0,0 +1,92 @@
+"""Measure the import time of the integration modules with -X importtime.
+
+Run from the repository root:
+
+    python benchmarks/importtime.py
+    python benchmarks/importtime.py --budget-ms 150 custom_components.samil_power.config_flow
+
+Each module is imported in a fresh interpreter. The cumulative import time and
+the heaviest imports below it are printed, and the exit code is 1 when a module
+exceeds the budget, so the numbers can be tracked as the integration grows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = (
+    # Imported by Home Assistant at boot
+    "custom_components.samil_power",
+    "custom_components.samil_power.config_flow",
+    "custom_components.samil_power.binary_sensor",
+    "custom_components.samil_power.sensor",
+    # Must not load the samil protocol code or numpy
+    "custom_components.samil_power.api",
+)
+
+
+def measure(module: str) -> tuple[int, list[tuple[int, str]]] | str:
+    """Return the cumulative import time of a module in µs and its imports.
+
+    Returns the error output instead when the module cannot be imported.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if process.returncode:
+        return process.stderr.strip().splitlines()[-1]
+
+    lines = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line[len("import time:"):].split("|")
+        lines.append((int(cumulative), name.rstrip()))
+
+    # Children are printed before their parent and indented deeper
+    position = next(i for i, (_, name) in enumerate(lines) if name.strip() == module)
+    total, name = lines[position]
+    depth = len(name) - len(name.lstrip())
+    imports = []
+    for us, child in reversed(lines[:position]):
+        if len(child) - len(child.lstrip()) <= depth:
+            break
+        imports.append((us, child.strip()))
+    return total, imports
+
+
+def main() -> int:
+    """Measure the modules and compare them to the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    parser.add_argument("--budget-ms", type=float, help="fail when a module takes longer")
+    parser.add_argument("--top", type=int, default=5, help="heaviest imports to show")
+    args = parser.parse_args()
+
+    over_budget = False
+    for module in args.modules:
+        result = measure(module)
+        if isinstance(result, str):
+            print(f"{module}: not importable here ({result})")
+            continue
+        total, imports = result
+        print(f"{module}: {total / 1000:.1f} ms")
+        for us, name in sorted(imports, reverse=True)[: args.top]:
+            print(f"    {us / 1000:8.1f} ms  {name}")
+        if args.budget_ms is not None and total / 1000 > args.budget_ms:
+            print(f"    over budget of {args.budget_ms} ms")
+            over_budget = True
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,51 +10,80 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
-from homeassistant.const import Platform
-from homeassistant.loader import async_get_loaded_integration
-
-from .api import SamilPowerApiClient
 from .const import (
     CONF_INTERFACE,
     CONF_INVERTERS,
+    CONF_POLL_JITTER,
     CONF_SCAN_INTERVAL,
     DEFAULT_INTERFACE,
     DEFAULT_INVERTERS,
+    DEFAULT_POLL_JITTER,
     DEFAULT_SCAN_INTERVAL,
-    DOMAIN,
     LOGGER,
+    SIGNAL_ENTRY_UNLOADED,
 )
-from .coordinator import SamilPowerDataUpdateCoordinator
-from .data import SamilPowerData
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import SamilPowerConfigEntry
 
-# Only using the sensor platform for now
-PLATFORMS: list[Platform] = [
-    Platform.SENSOR,
+# Home Assistant is only imported once the integration is set up, so the package
+# can be imported without it by the headless collector (see collector.py)
+PLATFORMS: list[str] = [
+    "binary_sensor",
+    "sensor",
 ]
 
 
+def _import_modules() -> None:
+    """Import the modules needed to set up the integration (blocking)."""
+    from . import coordinator, data, metrics, scheduler, services, websocket_api  # noqa: F401
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register the metrics view, websocket commands and services, which serve all entries."""
+    # Load the Home Assistant side of the integration in the import executor,
+    # the imports here and in async_setup_entry then only look the modules up
+    await hass.async_add_import_executor_job(_import_modules)
+
+    from .metrics import SamilPowerMetricsView
+    from .services import async_register_services
+    from .websocket_api import async_register_websocket_commands
+
+    hass.http.register_view(SamilPowerMetricsView())
+    async_register_websocket_commands(hass)
+    async_register_services(hass)
+    return True
+
+
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: SamilPowerConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
+    from homeassistant.helpers.dispatcher import async_dispatcher_send
+    from homeassistant.loader import async_get_loaded_integration
+
+    from .api import SamilPowerApiClient
+    from .coordinator import SamilPowerDataUpdateCoordinator
+    from .data import SamilPowerData
+    from .scheduler import StaggeredPoller
+
     LOGGER.debug("Setting up Samil Power integration")
+
+    # Get configuration from entry, options override the initial setup data
+    config = {**entry.data, **entry.options}
+    interface = config.get(CONF_INTERFACE, DEFAULT_INTERFACE)
+    inverters = config.get(CONF_INVERTERS, DEFAULT_INVERTERS)
+    scan_interval = config.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
     
-    # Get configuration from entry
-    interface = entry.data.get(CONF_INTERFACE, DEFAULT_INTERFACE)
-    inverters = entry.data.get(CONF_INVERTERS, DEFAULT_INVERTERS)
-    scan_interval = entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-    
-    # Create coordinator with appropriate update interval
+    # The staggered poller drives the updates, the coordinator gets no interval
     coordinator = SamilPowerDataUpdateCoordinator(
         hass=hass,
-        update_interval=timedelta(seconds=scan_interval),
+        update_interval=None,
     )
     
     # Create API client
@@ -81,8 +110,25 @@ async def async_setup_entry(
     await coordinator.async_config_entry_first_refresh()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
-    
+
+    # Poll and probe every inverter at its own phase of the interval to spread the load
+    coordinator.poller = StaggeredPoller(
+        hass,
+        coordinator,
+        client,
+        interval=scan_interval,
+        jitter=config.get(CONF_POLL_JITTER, DEFAULT_POLL_JITTER),
+        seed=entry.entry_id,
+    )
+    coordinator.poller.start()
+    entry.async_on_unload(coordinator.poller.stop)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
+    # Ends the websocket subscriptions of this entry
+    entry.async_on_unload(
+        lambda: async_dispatcher_send(hass, SIGNAL_ENTRY_UNLOADED.format(entry.entry_id))
+    )
+
     # Add a callback to disconnect when unloaded
     async def async_disconnect_client():
         """Disconnect from the inverters when unloaded."""
@@ -90,6 +136,13 @@ async def async_setup_entry(
         
     entry.async_on_unload(async_disconnect_client)
 
+    async def async_close_history():
+        """Flush the history rings when unloaded."""
+        if coordinator.history is not None:
+            await hass.async_add_executor_job(coordinator.history.close)
+
+    entry.async_on_unload(async_close_history)
+
     return True
 
 
@@ -101,10 +154,35 @@ async def async_unload_entry(
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
-async def async_reload_entry(
+async def async_update_options(
     hass: HomeAssistant,
     entry: SamilPowerConfigEntry,
 ) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    """Apply changed options without dropping the existing connections.
+
+    A new scan interval or jitter only reschedules the polls and a higher inverter
+    count discovers just the additional units, the platforms add their
+    entities once they show up in the data. Anything else needs a reload.
+    """
+    config = {**entry.data, **entry.options}
+    client = entry.runtime_data.client
+    coordinator = entry.runtime_data.coordinator
+    interface = config.get(CONF_INTERFACE, DEFAULT_INTERFACE)
+    inverters = int(config.get(CONF_INVERTERS, DEFAULT_INVERTERS))
+    scan_interval = config.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+
+    if interface != client.interface or inverters < client.inverters_count:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    if timedelta(seconds=scan_interval) != coordinator.scan_interval:
+        LOGGER.debug("Changing scan interval to %s seconds", scan_interval)
+        coordinator.async_set_update_interval(timedelta(seconds=scan_interval))
+
+    if coordinator.poller is not None:
+        coordinator.poller.jitter = config.get(CONF_POLL_JITTER, DEFAULT_POLL_JITTER)
+
+    if inverters > client.inverters_count:
+        LOGGER.debug("Discovering inverters up to a total of %s", inverters)
+        if await client.async_add_inverters(inverters):
+            await coordinator.async_request_refresh()
@@ -0,0 +1,152 @@
+"""Site-wide aggregates over all inverters of a Samil Power config entry."""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Fields summed over all inverters
+SUM_FIELDS = ("output_power", "energy_today", "energy_total")
+
+# Counters keep their last known contribution while an inverter is unavailable,
+# otherwise the site total would drop and jump back once the unit returns, which
+# the recorder reads as a meter reset. energy_today of unavailable inverters is
+# cleared by reset_daily() when the local day changes
+COUNTER_FIELDS = ("energy_today", "energy_total")
+DAILY_FIELD = "energy_today"
+
+TEMPERATURE_FIELD = "internal_temperature"
+
+
+class SiteAggregate:
+    """Site totals maintained incrementally as single inverters update.
+
+    Each inverter's contribution is remembered so an update only subtracts the
+    old contribution and adds the new one, instead of re-summing the fleet.
+    Inverters are keyed by serial number, indices change on rediscovery.
+    Status values are ints or Decimals, so the running sums do not drift.
+
+    A counter total is unknown while any inverter has never reported that
+    counter, so a unit that is down at startup does not make it jump later.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty aggregate."""
+        self._contributions: dict[str, dict[str, Any]] = {}
+        self._totals: dict[str, Any] = dict.fromkeys(SUM_FIELDS, 0)
+        # Inverters without a known value per counter
+        self._unknown: dict[str, set[str]] = {field: set() for field in COUNTER_FIELDS}
+        self._available: set[str] = set()
+        self._temperatures: dict[str, Any] = {}
+        self._min_key: str | None = None
+        self._max_key: str | None = None
+
+    @property
+    def inverters(self) -> set[str]:
+        """Return the serial numbers of all inverters in the aggregate."""
+        return set(self._contributions)
+
+    @property
+    def available_inverters(self) -> int:
+        """Return the number of inverters that reported in their last update."""
+        return len(self._available)
+
+    @property
+    def min_temperature(self) -> Any:
+        """Return the lowest temperature of the available inverters."""
+        if self._min_key is None:
+            return None
+        return self._temperatures[self._min_key]
+
+    @property
+    def max_temperature(self) -> Any:
+        """Return the highest temperature of the available inverters."""
+        if self._max_key is None:
+            return None
+        return self._temperatures[self._max_key]
+
+    def total(self, field: str) -> Any:
+        """Return the site total for one of SUM_FIELDS."""
+        if not self._contributions or self._unknown.get(field):
+            return None
+        return self._totals[field]
+
+    def update(self, serial_number: str, status: dict[str, Any] | None) -> None:
+        """Replace the contribution of one inverter.
+
+        An empty or missing status marks the inverter as unavailable.
+        """
+        available = bool(status)
+        old = self._contributions.get(serial_number, {})
+        new = {}
+        for field in SUM_FIELDS:
+            value = status.get(field) if available else None
+            if field in COUNTER_FIELDS:
+                if value is None:
+                    value = old.get(field)
+                if value is None:
+                    self._unknown[field].add(serial_number)
+                else:
+                    self._unknown[field].discard(serial_number)
+            new[field] = value
+            self._totals[field] += (value or 0) - (old.get(field) or 0)
+        self._contributions[serial_number] = new
+
+        if available:
+            self._available.add(serial_number)
+        else:
+            self._available.discard(serial_number)
+
+        self._update_temperature(
+            serial_number, status.get(TEMPERATURE_FIELD) if available else None
+        )
+
+    def remove(self, serial_number: str) -> None:
+        """Drop an inverter from the aggregate completely."""
+        old = self._contributions.pop(serial_number, None)
+        if old is None:
+            return
+        for field in SUM_FIELDS:
+            self._totals[field] -= old[field] or 0
+        for unknown in self._unknown.values():
+            unknown.discard(serial_number)
+        self._available.discard(serial_number)
+        self._update_temperature(serial_number, None)
+
+    def reset_daily(self) -> None:
+        """Clear the daily energy of unavailable inverters, call when the day changes.
+
+        Available inverters reset their own counter when they start up.
+        """
+        for serial_number, contribution in self._contributions.items():
+            if serial_number in self._available:
+                continue
+            self._totals[DAILY_FIELD] -= contribution[DAILY_FIELD] or 0
+            contribution[DAILY_FIELD] = 0
+            self._unknown[DAILY_FIELD].discard(serial_number)
+
+    def _update_temperature(self, serial_number: str, value: Any) -> None:
+        """Track min/max temperature, rescanning only when an extreme moves away."""
+        if value is None:
+            if self._temperatures.pop(serial_number, None) is None:
+                return
+            if serial_number in (self._min_key, self._max_key):
+                self._rescan_temperatures()
+            return
+
+        self._temperatures[serial_number] = value
+        if serial_number in (self._min_key, self._max_key):
+            self._rescan_temperatures()
+            return
+        if self._min_key is None or value < self._temperatures[self._min_key]:
+            self._min_key = serial_number
+        if self._max_key is None or value > self._temperatures[self._max_key]:
+            self._max_key = serial_number
+
+    def _rescan_temperatures(self) -> None:
+        """Recompute the min/max temperature keys from scratch."""
+        temperatures = self._temperatures
+        if not temperatures:
+            self._min_key = self._max_key = None
+            return
+        self._min_key = min(temperatures, key=temperatures.__getitem__)
+        self._max_key = max(temperatures, key=temperatures.__getitem__)
@@ -0,0 +1,147 @@
+"""Vectorized production analytics over the history rings."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .history import HistoryRing
+
+# Resolution of the daily yield curve
+CURVE_BIN_SECONDS = 15 * 60
+
+# Output within this fraction of the rated power counts as clipped
+CLIPPING_THRESHOLD = 0.98
+
+# Strings are mismatched when their median relative difference exceeds this,
+# only counting samples above MISMATCH_MIN_POWER of the daily peak input
+MISMATCH_THRESHOLD = 0.2
+MISMATCH_MIN_POWER = 0.1
+
+
+def select_day(ring: HistoryRing, start: float, end: float) -> np.ndarray:
+    """Return the records with start <= timestamp < end, oldest first."""
+    parts = [
+        segment[(segment["timestamp"] >= start) & (segment["timestamp"] < end)]
+        for segment in ring.segments()
+    ]
+    return np.concatenate(parts) if len(parts) > 1 else parts[0]
+
+
+def analyze_day(
+    records: np.ndarray,
+    start: float,
+    end: float,
+    rated_power: float | None,
+) -> dict[str, Any]:
+    """Compute the yield curve, peak, clipping and string mismatch of one day."""
+    if len(records) == 0:
+        return {"samples": 0}
+
+    timestamps = records["timestamp"]
+    power = records["output_power"].astype(np.float64)
+    valid = ~np.isnan(power)
+
+    # Mean output power per bin, None for bins without samples
+    bins = ((timestamps - start) // CURVE_BIN_SECONDS).astype(np.intp)
+    n_bins = int(np.ceil((end - start) / CURVE_BIN_SECONDS))
+    sums = np.bincount(bins[valid], weights=power[valid], minlength=n_bins)
+    counts = np.bincount(bins[valid], minlength=n_bins)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        curve = sums / counts
+    curve_list = [None if np.isnan(value) else round(float(value), 1) for value in curve]
+
+    result: dict[str, Any] = {
+        "samples": int(len(records)),
+        "curve_interval": CURVE_BIN_SECONDS,
+        "curve": curve_list,
+        "energy": _nanmax(records["energy_today"]),
+        "peak_power": None,
+        "peak_time": None,
+    }
+    if valid.any():
+        peak = int(np.argmax(np.where(valid, power, -np.inf)))
+        result["peak_power"] = float(power[peak])
+        result["peak_time"] = float(timestamps[peak])
+
+    pv1 = np.nan_to_num(records["pv1_input_power"].astype(np.float64))
+    pv2 = np.nan_to_num(records["pv2_input_power"].astype(np.float64))
+    result.update(_clipping(timestamps, power, pv1 + pv2, rated_power))
+    result.update(_mismatch(records, pv1, pv2))
+    return result
+
+
+def _nanmax(values: np.ndarray) -> float | None:
+    """Return the maximum ignoring NaN, or None if there are no values."""
+    if np.isnan(values).all():
+        return None
+    # Stored as float32, round off the representation noise
+    return round(float(np.nanmax(values)), 3)
+
+
+def _clipping(
+    timestamps: np.ndarray,
+    power: np.ndarray,
+    pv_power: np.ndarray,
+    rated_power: float | None,
+) -> dict[str, Any]:
+    """Detect samples where output is flat at rated power while PV input rises."""
+    if not rated_power or len(power) < 2:
+        return {"clipping_samples": None, "clipping_seconds": None}
+    at_limit = power[1:] >= CLIPPING_THRESHOLD * rated_power
+    flat = np.abs(np.diff(power)) <= (1 - CLIPPING_THRESHOLD) * rated_power
+    rising = np.diff(pv_power) > 0
+    clipped = at_limit & flat & rising
+    return {
+        "clipping_samples": int(clipped.sum()),
+        "clipping_seconds": float(np.diff(timestamps)[clipped].sum()),
+    }
+
+
+def _mismatch(records: np.ndarray, pv1: np.ndarray, pv2: np.ndarray) -> dict[str, Any]:
+    """Compare the two PV strings over the productive part of the day."""
+    if np.isnan(records["pv2_input_power"]).all():
+        return {"string_mismatch": None, "string_mismatch_ratio": None}
+    total = pv1 + pv2
+    productive = total > MISMATCH_MIN_POWER * total.max()
+    if not productive.any():
+        return {"string_mismatch": None, "string_mismatch_ratio": None}
+    ratio = float(
+        np.median(np.abs(pv1[productive] - pv2[productive]) / total[productive])
+    )
+    return {
+        "string_mismatch": ratio > MISMATCH_THRESHOLD,
+        "string_mismatch_ratio": round(ratio, 3),
+    }
+
+
+class DailyAnalyticsCache:
+    """Per-day analytics results of the inverters of one config entry.
+
+    A result stays valid until a newer record lands in its day, so finished
+    days are computed once and the current day only after new polls.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._results: dict[tuple[str, float], tuple[float | None, dict[str, Any]]] = {}
+
+    def get(
+        self,
+        serial_number: str,
+        ring: HistoryRing,
+        start: float,
+        end: float,
+        rated_power: float | None,
+    ) -> dict[str, Any]:
+        """Return the analytics of one day, computing them if needed (blocking)."""
+        last = ring.last_timestamp
+        version = last if last is not None and start <= last < end else None
+        cached = self._results.get((serial_number, start))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        result = analyze_day(select_day(ring, start, end), start, end, rated_power)
+        self._results[(serial_number, start)] = (version, result)
+        return result
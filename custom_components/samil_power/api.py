@@ -3,17 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-import logging
-import socket
-from typing import Any, Dict, List, Tuple
+import threading
+import time
+from typing import Dict, List, Set
 
-import async_timeout
+from .const import LOGGER, PROBE_TIMEOUT
 
-from .const import LOGGER
-
-# Import the necessary modules from the samil package
-from samil.inverter import InverterFinder, KeepAliveInverter, InverterNotFoundError
-from samil.inverterutil import connect_inverters
+# The samil protocol code is imported in the executor methods below, so it is
+# only loaded once a connection is actually made
 
 
 class SamilPowerApiClientError(Exception):
@@ -46,6 +43,25 @@ class SamilPowerApiClient:
         self._inverters = []
         self._model_info = {}
         self._connected = False
+        # One lock per inverter, the samil Inverter methods are not thread-safe
+        self._locks: List[threading.Lock] = []
+        self._alive: Dict[int, bool] = {}
+        self._last_seen: Dict[int, float] = {}
+        self._last_error: Exception | None = None
+        # Inverters whose socket was closed after a failure, they only
+        # reconnect after a discovery broadcast
+        self._disconnected: Set[int] = set()
+        self._rediscovering = False
+
+    @property
+    def interface(self) -> str:
+        """Return the interface used for discovery."""
+        return self._interface
+
+    @property
+    def inverters_count(self) -> int:
+        """Return the number of inverters to discover."""
+        return self._inverters_count
 
     async def async_connect(self) -> None:
         """Connect to the inverters."""
@@ -61,6 +77,9 @@ class SamilPowerApiClient:
                 None, self._connect_inverters
             )
             self._connected = True
+            self._locks = [threading.Lock() for _ in self._inverters]
+            self._alive = {i: True for i in range(len(self._inverters))}
+            self._disconnected = set()
             
             LOGGER.info(f"Successfully connected to {len(self._inverters)} inverters")
             
@@ -71,10 +90,9 @@ class SamilPowerApiClient:
                 )
                 LOGGER.info(f"Inverter {i} model info: {self._model_info[i].get('model_name', 'Unknown')}, SN: {self._model_info[i].get('serial_number', 'Unknown')}")
                 
-        except InverterNotFoundError as exception:
-            msg = f"No inverters found - {exception}"
-            LOGGER.error(msg)
-            raise SamilPowerApiClientCommunicationError(msg) from exception
+        except SamilPowerApiClientCommunicationError as exception:
+            LOGGER.error(exception)
+            raise
         except Exception as exception:  # pylint: disable=broad-except
             msg = f"Error connecting to inverters - {exception}"
             LOGGER.error(msg)
@@ -82,6 +100,18 @@ class SamilPowerApiClient:
 
     def _connect_inverters(self):
         """Connect to the inverters (runs in executor)."""
+        from samil.inverter import InverterNotFoundError
+
+        try:
+            return self._find_all_inverters()
+        except InverterNotFoundError as exception:
+            msg = f"No inverters found - {exception}"
+            raise SamilPowerApiClientCommunicationError(msg) from exception
+
+    def _find_all_inverters(self):
+        """Find the configured number of inverters (runs in executor)."""
+        from samil.inverter import InverterFinder, InverterNotFoundError, KeepAliveInverter
+
         inverters = []
         try:
             LOGGER.debug(f"Starting inverter connection with interface={self._interface}, count={self._inverters_count}")
@@ -137,33 +167,294 @@ class SamilPowerApiClient:
             
         return inverters
 
+    async def async_add_inverters(self, inverters: int) -> int:
+        """Discover inverters up to the new count, keeping existing connections.
+
+        Returns the number of newly connected inverters.
+        """
+        self._inverters_count = int(inverters)
+        missing = self._inverters_count - len(self._inverters)
+        if not self._connected or missing <= 0:
+            # A (re)connect discovers the full count anyway
+            return 0
+        if self._rediscovering:
+            # That search adds the missing inverters, or the next one does
+            return 0
+
+        connected = len(self._inverters)
+        loop = asyncio.get_event_loop()
+        found = await loop.run_in_executor(None, self._find_inverters, missing)
+        for inverter in found:
+            i = len(self._inverters)
+            try:
+                self._model_info[i] = await loop.run_in_executor(None, inverter.model)
+            except Exception as exception:  # pylint: disable=broad-except
+                LOGGER.error(f"Error getting model info of new inverter: {exception}")
+                inverter.disconnect()
+                continue
+            LOGGER.info(f"Inverter {i} model info: {self._model_info[i].get('model_name', 'Unknown')}, SN: {self._model_info[i].get('serial_number', 'Unknown')}")
+            self._locks.append(threading.Lock())
+            self._alive[i] = True
+            self._inverters.append(inverter)
+        return len(self._inverters) - connected
+
+    def _find_inverters(self, count: int) -> list:
+        """Find up to count additional inverters (runs in executor)."""
+        from samil.inverter import InverterFinder, InverterNotFoundError, KeepAliveInverter
+
+        inverters = []
+        finder = InverterFinder(interface_ip=self._interface)
+        finder.open_with_retries()
+        try:
+            for i in range(count):
+                try:
+                    sock, addr = finder.find_inverter()
+                except InverterNotFoundError:
+                    LOGGER.warning(f"Found only {i} of {count} additional inverters")
+                    break
+                LOGGER.info(f"Found additional inverter at address {addr}")
+                inverters.append(KeepAliveInverter(sock, addr))
+        finally:
+            finder.close()
+        return inverters
+
+    @property
+    def connected(self) -> bool:
+        """Return whether the inverters are connected."""
+        return self._connected
+
+    @property
+    def connected_count(self) -> int:
+        """Return the number of connected inverters."""
+        return len(self._inverters)
+
     async def async_get_data(self) -> Dict[int, Dict]:
-        """Get data from the inverters."""
+        """Get data from the inverters.
+
+        Inverters that are known to be down are skipped and returned with an
+        empty status, so a single dead unit does not stall the whole poll.
+        The probe rediscovers them and marks them alive again.
+        """
         if not self._connected:
             await self.async_connect()
 
+        # Get status for each inverter
+        status_data = {}
+        for i in range(len(self._inverters)):
+            status_data[i] = await self.async_get_inverter_data(i)
+
+        await self.async_check_connection()
+        return status_data
+
+    async def async_get_inverter_data(self, index: int) -> Dict:
+        """Get the model info and status of one inverter.
+
+        The status is empty when the inverter is down or does not respond.
+        """
+        status = {}
+        if self._alive.get(index, True):
+            loop = asyncio.get_event_loop()
+            try:
+                status = await loop.run_in_executor(None, self._get_status, index)
+            except Exception as exception:  # pylint: disable=broad-except
+                LOGGER.warning(f"Inverter {index} did not respond, marking it down: {exception}")
+                self._alive[index] = False
+                self._last_error = exception
+
+        # Combine with model info
+        return {
+            "model": self._model_info.get(index, {}),
+            "status": status
+        }
+
+    async def async_check_connection(self) -> None:
+        """Disconnect and raise if every inverter is down, to rediscover on the next poll."""
+        if any(self._alive.values()):
+            return
+        await self.async_disconnect()
+        msg = f"Error getting data from inverters - {self._last_error or 'all inverters down'}"
+        raise SamilPowerApiClientError(msg)
+
+    def _get_status(self, index: int) -> Dict:
+        """Get the status of one inverter (runs in executor)."""
+        with self._locks[index]:
+            try:
+                status = self._inverters[index].status()
+            except Exception:
+                self._drop(index)
+                raise
+        self._last_seen[index] = time.monotonic()
+        return status
+
+    def _drop(self, index: int) -> None:
+        """Close the socket of a failed inverter, the caller holds its lock.
+
+        After a timeout the buffered socket file can hold a partial message,
+        so the connection is not reused. The inverter is rediscovered instead.
+        """
+        try:
+            self._inverters[index].disconnect()
+        except Exception:  # pylint: disable=broad-except
+            pass
+        self._disconnected.add(index)
+
+    def is_alive(self, index: int) -> bool:
+        """Return whether the inverter answered its last poll or probe."""
+        return self._connected and self._alive.get(index, False)
+
+    async def async_probe(self, max_age: float) -> bool:
+        """Probe inverters not heard from within max_age seconds and rediscover dropped ones.
+
+        Returns True if the liveness of any inverter changed.
+        """
+        changed = False
+        for i in range(self.connected_count):
+            changed |= await self.async_probe_inverter(i, max_age)
+        changed |= await self.async_rediscover()
+        return changed
+
+    async def async_probe_inverter(self, index: int, max_age: float) -> bool:
+        """Probe one inverter if it was not heard from within max_age seconds.
+
+        Returns True if its liveness changed.
+        """
+        if not self._connected or index >= len(self._inverters):
+            return False
+        if index in self._disconnected:
+            # Nothing to probe, async_rediscover brings it back
+            return False
+        if self._alive.get(index) and time.monotonic() - self._last_seen.get(index, 0) < max_age:
+            return False
+
+        loop = asyncio.get_event_loop()
+        alive = await loop.run_in_executor(None, self._probe, index)
+        if alive is None or alive == self._alive.get(index):
+            return False
+        LOGGER.info(f"Inverter {index} is now {'up' if alive else 'down'}")
+        self._alive[index] = alive
+        return True
+
+    def _probe(self, index: int) -> bool | None:
+        """Send a short request with a short timeout (runs in executor).
+
+        Returns None if the inverter is busy with a status poll.
+        """
+        lock = self._locks[index]
+        if not lock.acquire(blocking=False):
+            return None
+        inverter = self._inverters[index]
+        try:
+            inverter.sock.settimeout(PROBE_TIMEOUT)
+            try:
+                inverter.status_format()
+            finally:
+                inverter.sock.settimeout(30.0)
+        except Exception as exception:  # pylint: disable=broad-except
+            LOGGER.debug(f"Probe of inverter {index} failed: {exception}")
+            self._drop(index)
+            return False
+        finally:
+            lock.release()
+        self._last_seen[index] = time.monotonic()
+        return True
+
+    async def async_rediscover(self) -> bool:
+        """Reconnect dropped inverters and connect configured ones not found yet.
+
+        Returns True if any inverter came back or was added.
+        """
+        if not self._connected or self._rediscovering:
+            return False
+        if not self._disconnected and len(self._inverters) >= self._inverters_count:
+            return False
+
+        self._rediscovering = True
         try:
-            # Run the status requests in a separate thread to avoid blocking
             loop = asyncio.get_event_loop()
-            
-            # Get status for each inverter
-            status_data = {}
-            for i, inverter in enumerate(self._inverters):
-                status = await loop.run_in_executor(None, inverter.status)
-                
-                # Combine with model info
-                combined_data = {
-                    "model": self._model_info.get(i, {}),
-                    "status": status
-                }
-                status_data[i] = combined_data
-                
-            return status_data
-            
+            restored = await loop.run_in_executor(None, self._rediscover)
         except Exception as exception:  # pylint: disable=broad-except
-            self._connected = False  # Mark as disconnected on error
-            msg = f"Error getting data from inverters - {exception}"
-            raise SamilPowerApiClientError(msg) from exception
+            LOGGER.debug(f"Rediscovery failed: {exception}")
+            return False
+        finally:
+            self._rediscovering = False
+
+        for i in restored:
+            LOGGER.info(f"Inverter {i} is now up")
+            self._alive[i] = True
+        return bool(restored)
+
+    def _rediscover(self) -> List[int]:
+        """Search for dropped and missing inverters, one short search each (runs in executor).
+
+        A found inverter only goes back to the index with the same serial
+        number, so entities keep showing the same unit. An unknown inverter is
+        added while fewer than the configured number are connected, otherwise
+        it is disconnected and the search continues. Returns the restored or
+        added indices.
+        """
+        from samil.inverter import InverterFinder, InverterNotFoundError, KeepAliveInverter
+
+        inverters = self._inverters
+        restored = []
+        finder = InverterFinder(interface_ip=self._interface)
+        finder.open_with_retries()
+        try:
+            # Bounded, an extra unit on the network may answer every search
+            for _ in range(self._inverters_count + 1):
+                if not self._disconnected and len(inverters) >= self._inverters_count:
+                    break
+                try:
+                    sock, addr = finder.find_inverter(
+                        advertisements=1, interval=PROBE_TIMEOUT
+                    )
+                except InverterNotFoundError:
+                    break
+                inverter = KeepAliveInverter(sock, addr)
+                try:
+                    model = inverter.model()
+                except Exception as exception:  # pylint: disable=broad-except
+                    LOGGER.debug(f"Error getting model info of rediscovered inverter: {exception}")
+                    inverter.disconnect()
+                    continue
+                if self._inverters is not inverters:
+                    # Disconnected meanwhile, the next full connect finds it
+                    inverter.disconnect()
+                    break
+
+                index = self._index_for(model.get("serial_number"))
+                if index is None:
+                    if len(inverters) >= self._inverters_count:
+                        LOGGER.debug(f"Ignoring unknown inverter at address {addr}")
+                        inverter.disconnect()
+                        continue
+                    index = len(inverters)
+                    self._model_info[index] = model
+                    self._locks.append(threading.Lock())
+                    inverters.append(inverter)
+                    LOGGER.info(f"Found additional inverter {index} at address {addr}")
+                else:
+                    with self._locks[index]:
+                        if index not in self._disconnected:
+                            # It reconnected before its failure was noticed
+                            self._drop(index)
+                        inverters[index] = inverter
+                        self._model_info[index] = model
+                        self._disconnected.discard(index)
+                    LOGGER.info(f"Rediscovered inverter {index} at address {addr}")
+                self._last_seen[index] = time.monotonic()
+                restored.append(index)
+        finally:
+            finder.close()
+        return restored
+
+    def _index_for(self, serial_number: str | None) -> int | None:
+        """Return the index of the inverter with this serial number."""
+        if serial_number is None:
+            return None
+        for i, model in self._model_info.items():
+            if i < len(self._inverters) and model.get("serial_number") == serial_number:
+                return i
+        return None
 
     async def async_disconnect(self) -> None:
         """Disconnect from the inverters."""
@@ -177,4 +468,8 @@ class SamilPowerApiClient:
                 pass
                 
         self._inverters = []
+        self._locks = []
+        self._alive = {}
+        self._last_seen = {}
+        self._disconnected = set()
         self._connected = False
@@ -1,4 +1,4 @@
-"""Binary sensor platform for integration_blueprint."""
+"""Binary sensor platform for Samil Power integration."""
 
 from __future__ import annotations
 
@@ -9,53 +9,89 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
+from homeassistant.const import EntityCategory
+from homeassistant.core import callback
 
-from .entity import IntegrationBlueprintEntity
+from .const import LOGGER
+from .entity import SamilPowerEntity
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from .coordinator import BlueprintDataUpdateCoordinator
-    from .data import IntegrationBlueprintConfigEntry
+    from .coordinator import SamilPowerDataUpdateCoordinator
+    from .data import SamilPowerConfigEntry
+
 
 ENTITY_DESCRIPTIONS = (
     BinarySensorEntityDescription(
-        key="integration_blueprint",
-        name="Integration Blueprint Binary Sensor",
+        key="connectivity",
+        name="Connectivity",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
 )
 
 
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
-    entry: IntegrationBlueprintConfigEntry,
+    entry: SamilPowerConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up the binary_sensor platform."""
-    async_add_entities(
-        IntegrationBlueprintBinarySensor(
-            coordinator=entry.runtime_data.coordinator,
-            entity_description=entity_description,
-        )
-        for entity_description in ENTITY_DESCRIPTIONS
-    )
+    """Set up the Samil Power binary sensor platform."""
+    coordinator = entry.runtime_data.coordinator
+
+    known_inverters: set[int] = set()
+
+    @callback
+    def async_add_new_inverters() -> None:
+        """Add binary sensors for inverters that are not set up yet."""
+        entities = []
+        for inverter_index in coordinator.data or {}:
+            if inverter_index in known_inverters:
+                continue
+            known_inverters.add(inverter_index)
+            LOGGER.debug(
+                "Setting up binary sensors for inverter %s", inverter_index
+            )
+            for description in ENTITY_DESCRIPTIONS:
+                entities.append(
+                    SamilPowerConnectivitySensor(
+                        coordinator=coordinator,
+                        entity_description=description,
+                        inverter_index=inverter_index,
+                    )
+                )
+
+        if entities:
+            async_add_entities(entities)
 
+    async_add_new_inverters()
+    # Inverters added through the options are discovered while running
+    entry.async_on_unload(coordinator.async_add_listener(async_add_new_inverters))
 
-class IntegrationBlueprintBinarySensor(IntegrationBlueprintEntity, BinarySensorEntity):
-    """integration_blueprint binary_sensor class."""
+
+class SamilPowerConnectivitySensor(SamilPowerEntity, BinarySensorEntity):
+    """Connectivity of a single inverter, driven by polls and probes."""
 
     def __init__(
         self,
-        coordinator: BlueprintDataUpdateCoordinator,
+        coordinator: SamilPowerDataUpdateCoordinator,
         entity_description: BinarySensorEntityDescription,
+        inverter_index: int,
     ) -> None:
         """Initialize the binary_sensor class."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, inverter_index, entity_description)
         self.entity_description = entity_description
 
+    @property
+    def available(self) -> bool:
+        """Return True, the connectivity sensor reports the outage itself."""
+        return True
+
     @property
     def is_on(self) -> bool:
-        """Return true if the binary_sensor is on."""
-        return self.coordinator.data.get("title", "") == "foo"
+        """Return true if the inverter is reachable."""
+        return self.coordinator.config_entry.runtime_data.client.is_alive(
+            self.inverter_index
+        )
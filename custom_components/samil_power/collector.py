@@ -0,0 +1,222 @@
+"""Headless collector that polls Samil Power inverters without Home Assistant.
+
+Uses the same SamilPowerApiClient as the integration and streams one row per
+inverter per poll to CSV or line-delimited JSON files:
+
+    python -m custom_components.samil_power.collector --inverters 2 \\
+        --interval 10 --format jsonl --output samil.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import logging
+import os
+import signal
+import time
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+from .api import SamilPowerApiClient, SamilPowerApiClientError
+from .const import DEFAULT_INTERFACE, DEFAULT_INVERTERS, DEFAULT_SCAN_INTERVAL, LOGGER
+
+FORMATS = ("csv", "jsonl")
+
+
+class RotatingRowWriter:
+    """Buffers rows and appends them to a file in batches, rotating by size.
+
+    Rotated files are renamed to <output>.1, <output>.2, ... like
+    logging.handlers.RotatingFileHandler. CSV files get a header row each time
+    a new file is started.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fmt: str,
+        fields: list[str],
+        batch_size: int = 100,
+        flush_interval: float = 60.0,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+    ) -> None:
+        """Initialize the writer."""
+        self._path = path
+        self._format = fmt
+        self._fields = fields
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._buffer: list[str] = []
+        self._last_flush = time.monotonic()
+
+    def write(self, row: dict[str, Any]) -> None:
+        """Buffer a row, flushing when the batch is full or old enough."""
+        self._buffer.append(self._serialize(row))
+        if (
+            len(self._buffer) >= self._batch_size
+            or time.monotonic() - self._last_flush >= self._flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered rows with a single write call."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        data = "".join(self._buffer)
+        self._buffer.clear()
+
+        if self._max_bytes and os.path.exists(self._path):
+            if os.path.getsize(self._path) + len(data) > self._max_bytes:
+                self._rotate()
+
+        new_file = not os.path.exists(self._path) or os.path.getsize(self._path) == 0
+        with open(self._path, "a", encoding="utf-8", newline="") as file:
+            if new_file and self._format == "csv":
+                file.write(self._serialize(dict(zip(self._fields, self._fields))))
+            file.write(data)
+
+    def _rotate(self) -> None:
+        """Shift <output>.N files up by one and start a new file."""
+        if self._backup_count <= 0:
+            os.remove(self._path)
+            return
+        for i in range(self._backup_count - 1, 0, -1):
+            source = f"{self._path}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self._path}.{i + 1}")
+        os.replace(self._path, f"{self._path}.1")
+
+    def _serialize(self, row: dict[str, Any]) -> str:
+        """Serialize a row to a line."""
+        if self._format == "jsonl":
+            return json.dumps(row, default=_json_default) + "\n"
+        line = io.StringIO()
+        csv.DictWriter(line, self._fields, extrasaction="ignore").writerow(row)
+        return line.getvalue()
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize the Decimal values returned by the inverters."""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _rows(data: dict[int, dict], timestamp: str) -> list[dict[str, Any]]:
+    """Turn one poll into one row per inverter that reported."""
+    rows = []
+    for index, inverter in data.items():
+        if not inverter.get("status"):
+            continue
+        rows.append(
+            {
+                "timestamp": timestamp,
+                "inverter": index,
+                "serial_number": inverter.get("model", {}).get("serial_number"),
+                **inverter["status"],
+            }
+        )
+    return rows
+
+
+async def async_collect(
+    client: SamilPowerApiClient,
+    writer: RotatingRowWriter,
+    interval: float,
+) -> None:
+    """Poll the inverters on a fixed schedule until cancelled."""
+    loop = asyncio.get_running_loop()
+    next_poll = loop.time()
+    try:
+        while True:
+            # Polls skip inverters that failed, the probe brings them back.
+            # Units polled every interval are recent enough to not be probed.
+            await client.async_probe(max_age=2 * interval)
+            try:
+                data = await client.async_get_data()
+            except SamilPowerApiClientError as exception:
+                LOGGER.warning("Poll failed: %s", exception)
+            else:
+                timestamp = datetime.now(UTC).isoformat()
+                for row in _rows(data, timestamp):
+                    writer.write(row)
+
+            # Fixed rate, skipping missed polls instead of bursting to catch up
+            next_poll += interval
+            now = loop.time()
+            if next_poll < now:
+                next_poll = now
+            await asyncio.sleep(next_poll - now)
+    finally:
+        writer.flush()
+        await client.async_disconnect()
+
+
+async def _async_run(
+    client: SamilPowerApiClient,
+    writer: RotatingRowWriter,
+    interval: float,
+) -> None:
+    """Collect until SIGTERM or SIGINT, flushing the buffered rows either way."""
+    loop = asyncio.get_running_loop()
+    task = asyncio.create_task(async_collect(client, writer, interval))
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(signum, task.cancel)
+        except NotImplementedError:
+            # Windows, Ctrl+C still cancels through asyncio.run
+            pass
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the collector from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--interface", default=DEFAULT_INTERFACE, help="interface IP to discover inverters on")
+    parser.add_argument("--inverters", type=int, default=DEFAULT_INVERTERS, help="number of inverters to discover")
+    parser.add_argument("--interval", type=float, default=DEFAULT_SCAN_INTERVAL, help="seconds between polls")
+    parser.add_argument("--format", choices=FORMATS, default="csv", help="output format")
+    parser.add_argument("--output", required=True, help="output file")
+    parser.add_argument("--batch-size", type=int, default=100, help="rows buffered before writing")
+    parser.add_argument("--flush-interval", type=float, default=60.0, help="maximum seconds rows stay buffered")
+    parser.add_argument("--max-bytes", type=int, default=10 * 1024 * 1024, help="rotate when the file exceeds this size, 0 disables")
+    parser.add_argument("--backup-count", type=int, default=5, help="number of rotated files to keep")
+    parser.add_argument("--verbose", action="store_true", help="enable debug logging")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+
+    # The status fields supported by the samil package, for stable CSV columns
+    from samil.statustypes import status_types
+
+    writer = RotatingRowWriter(
+        path=args.output,
+        fmt=args.format,
+        fields=["timestamp", "inverter", "serial_number", *status_types],
+        batch_size=args.batch_size,
+        flush_interval=args.flush_interval,
+        max_bytes=args.max_bytes,
+        backup_count=args.backup_count,
+    )
+    client = SamilPowerApiClient(interface=args.interface, inverters=args.inverters)
+
+    try:
+        asyncio.run(_async_run(client, writer, args.interval))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.helpers import selector
 
 from .api import (
@@ -15,9 +16,11 @@ from .api import (
 from .const import (
     CONF_INTERFACE,
     CONF_INVERTERS,
+    CONF_POLL_JITTER,
     CONF_SCAN_INTERVAL,
     DEFAULT_INTERFACE,
     DEFAULT_INVERTERS,
+    DEFAULT_POLL_JITTER,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     LOGGER,
@@ -29,6 +32,14 @@ class SamilPowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> SamilPowerOptionsFlow:
+        """Return the options flow."""
+        return SamilPowerOptionsFlow()
+
     async def async_step_user(
         self,
         user_input: dict | None = None,
@@ -107,3 +118,56 @@ class SamilPowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
         await client.async_connect()
         await client.async_disconnect()
+
+
+class SamilPowerOptionsFlow(config_entries.OptionsFlow):
+    """Options flow for Samil Power, applied without reloading the entry."""
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        config = {**self.config_entry.data, **self.config_entry.options}
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_INVERTERS,
+                        default=config.get(CONF_INVERTERS, DEFAULT_INVERTERS),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1,
+                            max=10,
+                            mode=selector.NumberSelectorMode.BOX,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL,
+                        default=config.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=10,
+                            max=300,
+                            unit_of_measurement="seconds",
+                            mode=selector.NumberSelectorMode.BOX,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_POLL_JITTER,
+                        default=config.get(CONF_POLL_JITTER, DEFAULT_POLL_JITTER),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=30,
+                            unit_of_measurement="seconds",
+                            mode=selector.NumberSelectorMode.BOX,
+                        ),
+                    ),
+                },
+            ),
+        )
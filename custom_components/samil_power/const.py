@@ -11,8 +11,20 @@ ATTRIBUTION = "Data provided by Samil Power inverter"
 CONF_INTERFACE = "interface"
 CONF_INVERTERS = "inverters"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_POLL_JITTER = "poll_jitter"
 
 # Default values
 DEFAULT_INTERFACE = ""
 DEFAULT_INVERTERS = 1
 DEFAULT_SCAN_INTERVAL = 30  # seconds
+DEFAULT_POLL_JITTER = 2  # seconds
+
+# Dispatcher signal sent when an entry unloads, formatted with the entry id
+SIGNAL_ENTRY_UNLOADED = f"{DOMAIN}_entry_unloaded_{{}}"
+
+# Liveness probing
+PROBE_INTERVAL = 10  # seconds
+PROBE_TIMEOUT = 3.0  # seconds
+
+# History ring buffer, two weeks at the default scan interval
+HISTORY_CAPACITY = 14 * 24 * 3600 // DEFAULT_SCAN_INTERVAL  # records per inverter
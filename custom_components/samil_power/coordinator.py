@@ -2,21 +2,31 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import threading
+import time
+from datetime import date, timedelta
 from typing import TYPE_CHECKING, Any, Dict
 
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .aggregate import SiteAggregate
 from .api import (
     SamilPowerApiClientAuthenticationError,
     SamilPowerApiClientError,
 )
-from .const import LOGGER
+from .const import DOMAIN, HISTORY_CAPACITY, LOGGER
+from .metrics import render_families
+from .validation import SampleValidator
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+
+    from .analytics import DailyAnalyticsCache
     from .data import SamilPowerConfigEntry
+    from .history import HistoryRing, HistoryStore
+    from .scheduler import StaggeredPoller
 
 
 class SamilPowerDataUpdateCoordinator(DataUpdateCoordinator):
@@ -27,7 +37,7 @@ class SamilPowerDataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(
         self,
         hass: HomeAssistant,
-        update_interval: timedelta,
+        update_interval: timedelta | None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -37,14 +47,139 @@ class SamilPowerDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=update_interval,
         )
         self.inverter_data: Dict[int, Dict] = {}
+        self.site = SiteAggregate()
+        self._site_day: date | None = None
+        self.validator = SampleValidator()
+        self.poll_stats: Dict[str, Any] = {
+            "samil_poll_total": 0,
+            "samil_poll_failures_total": 0,
+            "samil_poll_duration_seconds": 0.0,
+            "samil_poll_duration_seconds_total": 0.0,
+            "samil_rejected_samples_total": 0,
+        }
+        # Pre-rendered Prometheus metrics, served as-is by the metrics view
+        self.metrics: Dict[str, Any] = {}
+        # Created on first use, numpy is only imported when history is recorded
+        self.history: HistoryStore | None = None
+        # Rings are opened from executor jobs of both polls and services
+        self._history_lock = threading.Lock()
+        self.analytics: DailyAnalyticsCache | None = None
+        # Set when polls are staggered, then the coordinator has no interval itself
+        self.poller: StaggeredPoller | None = None
+
+    @property
+    def scan_interval(self) -> timedelta:
+        """Return the interval all inverters are polled at."""
+        if self.poller is not None:
+            return timedelta(seconds=self.poller.interval)
+        return self.update_interval
+
+    def async_set_update_interval(self, update_interval: timedelta) -> None:
+        """Change the poll interval and reschedule the next poll."""
+        if self.poller is not None:
+            self.poller.set_interval(update_interval.total_seconds())
+            return
+        self.update_interval = update_interval
+        if self._listeners:
+            self._schedule_refresh()
 
     async def _async_update_data(self) -> Dict[int, Dict]:
-        """Update data via library."""
+        """Update data via library and refresh the metrics snapshot."""
+        start = time.monotonic()
+        failed = True
+        try:
+            data = await self._async_poll()
+            failed = False
+            return data
+        finally:
+            self._record_poll(time.monotonic() - start, failed)
+
+    async def async_publish(self, data: Dict[int, Dict], duration: float) -> None:
+        """Publish one staggered poll cycle of all inverters as a single snapshot."""
+        try:
+            await self.config_entry.runtime_data.client.async_check_connection()
+        except SamilPowerApiClientError as exception:
+            self._record_poll(duration, failed=True)
+            self.async_set_update_error(UpdateFailed(exception))
+            return
+        await self._async_process(data)
+        self._record_poll(duration, failed=False)
+        self.async_set_updated_data(data)
+
+    def _record_poll(self, duration: float, failed: bool) -> None:
+        """Update the poll counters and re-render the metrics."""
+        if failed:
+            self.poll_stats["samil_poll_failures_total"] += 1
+        self.poll_stats["samil_poll_total"] += 1
+        self.poll_stats["samil_poll_duration_seconds"] = duration
+        self.poll_stats["samil_poll_duration_seconds_total"] += duration
+        self.metrics = render_families(self)
+
+    async def _async_poll(self) -> Dict[int, Dict]:
+        """Poll all inverters."""
         try:
-            self.inverter_data = await self.config_entry.runtime_data.client.async_get_data()
-            LOGGER.debug("Updated inverter data: %s", self.inverter_data)
-            return self.inverter_data
+            data = await self.config_entry.runtime_data.client.async_get_data()
         except SamilPowerApiClientAuthenticationError as exception:
             raise ConfigEntryAuthFailed(exception) from exception
         except SamilPowerApiClientError as exception:
             raise UpdateFailed(exception) from exception
+        await self._async_process(data)
+        return data
+
+    async def _async_process(self, data: Dict[int, Dict]) -> None:
+        """Validate a new snapshot and update the site totals and history."""
+        self.inverter_data = data
+        LOGGER.debug("Updated inverter data: %s", self.inverter_data)
+        timestamp = time.time()
+        today = dt_util.now().date()
+        if today != self._site_day:
+            # Units that are down at midnight produced nothing yet today
+            self.site.reset_daily()
+            self._site_day = today
+        reported = set()
+        records = []
+        for index, inverter in self.inverter_data.items():
+            serial_number = _serial_number(index, inverter)
+            reported.add(serial_number)
+            if inverter.get("status"):
+                inverter["status"], rejected = self.validator.validate(
+                    serial_number, inverter.get("model", {}), inverter["status"], timestamp
+                )
+                if rejected:
+                    LOGGER.debug("Rejected implausible %s of inverter %s", rejected, serial_number)
+                    self.poll_stats["samil_rejected_samples_total"] += len(rejected)
+            else:
+                self.validator.reset(serial_number)
+            status = inverter.get("status")
+            self.site.update(serial_number, status)
+            if status:
+                records.append((serial_number, status))
+        # Units that were not rediscovered are unavailable, not gone
+        for serial_number in self.site.inverters - reported:
+            self.site.update(serial_number, None)
+            self.validator.reset(serial_number)
+        if records:
+            await self.hass.async_add_executor_job(self._record_history, timestamp, records)
+
+    def _record_history(self, timestamp: float, records: list[tuple[str, Dict]]) -> None:
+        """Append one snapshot to the history rings (runs in executor).
+
+        Writing to a page of the memory map that is not cached reads it from
+        disk first, which must not happen on the event loop.
+        """
+        for serial_number, status in records:
+            self.open_history(serial_number).append(timestamp, status)
+
+    def open_history(self, serial_number: str) -> HistoryRing:
+        """Open the history ring of an inverter (blocking)."""
+        from .history import HistoryStore
+
+        with self._history_lock:
+            if self.history is None:
+                self.history = HistoryStore(self.hass.config.path(DOMAIN), HISTORY_CAPACITY)
+            return self.history.open(serial_number)
+
+
+def _serial_number(index: int, data: Dict) -> str:
+    """Return the serial number of an inverter, falling back to its index."""
+    return data.get("model", {}).get("serial_number", f"unknown_{index}")
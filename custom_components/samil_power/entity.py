@@ -48,8 +48,38 @@ class SamilPowerEntity(CoordinatorEntity[SamilPowerDataUpdateCoordinator]):
             sw_version=model_info.get("firmware_version", "Unknown"),
         )
 
+    @property
+    def available(self) -> bool:
+        """Return True if the inverter answered its last poll or probe."""
+        return super().available and self.coordinator.config_entry.runtime_data.client.is_alive(
+            self.inverter_index
+        )
+
     def get_inverter_data(self) -> Dict[str, Any]:
         """Get the current data for this inverter."""
         if not self.coordinator.data:
             return {}
         return self.coordinator.data.get(self.inverter_index, {})
+
+
+class SamilPowerSiteEntity(CoordinatorEntity[SamilPowerDataUpdateCoordinator]):
+    """Entity on the site device aggregating all inverters of an entry."""
+
+    _attr_attribution = ATTRIBUTION
+
+    def __init__(
+        self,
+        coordinator: SamilPowerDataUpdateCoordinator,
+        entity_description,
+    ) -> None:
+        """Initialize."""
+        super().__init__(coordinator)
+        entry_id = coordinator.config_entry.entry_id
+        self._attr_unique_id = f"{entry_id}_site_{entity_description.key}"
+        self._attr_entity_id = f"samil_site_{entity_description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry_id}_site")},
+            name="Samil Power Site",
+            manufacturer="Samil Power",
+            model="Site",
+        )
@@ -0,0 +1,176 @@
+"""Memory-mapped ring buffers holding the full-resolution status history."""
+
+from __future__ import annotations
+
+import os
+import zlib
+from typing import Any
+
+import numpy as np
+
+from .const import LOGGER
+
+# Numeric status fields as reported by the samil package, stored as float32
+HISTORY_FIELDS = (
+    "total_operation_time",
+    "pv1_input_power",
+    "pv2_input_power",
+    "pv1_voltage",
+    "pv2_voltage",
+    "pv1_current",
+    "pv2_current",
+    "output_power",
+    "energy_today",
+    "energy_total",
+    "grid_voltage",
+    "grid_current",
+    "grid_frequency",
+    "grid_voltage_r_phase",
+    "grid_current_r_phase",
+    "grid_frequency_r_phase",
+    "grid_voltage_s_phase",
+    "grid_current_s_phase",
+    "grid_frequency_s_phase",
+    "grid_voltage_t_phase",
+    "grid_current_t_phase",
+    "grid_frequency_t_phase",
+    "internal_temperature",
+    "heatsink_temperature",
+)
+
+# Operation mode is stored as a code, -1 when missing
+OPERATION_MODES = ("Wait", "Normal", "Fault", "Permanent fault", "Check", "PV power off")
+
+RECORD_DTYPE = np.dtype(
+    [("timestamp", "<f8"), ("operation_mode", "i1")]
+    + [(field, "<f4") for field in HISTORY_FIELDS]
+)
+
+HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("layout", "<u4"),
+        ("capacity", "<u8"),
+        ("head", "<u8"),
+        ("count", "<u8"),
+    ]
+)
+
+MAGIC = b"SAMILRNG"
+# Changes whenever RECORD_DTYPE changes, which invalidates existing files
+LAYOUT = zlib.crc32(repr(RECORD_DTYPE.descr).encode())
+
+
+class HistoryRing:
+    """Fixed-size ring of status records for one inverter, backed by a file.
+
+    The file holds a one-record header followed by `capacity` records, so its
+    size and the memory footprint never grow. Blocking: open and close must
+    run in an executor.
+    """
+
+    def __init__(self, path: str, capacity: int) -> None:
+        """Open the ring file, creating or resetting it if needed."""
+        self.path = path
+        size = HEADER_DTYPE.itemsize + capacity * RECORD_DTYPE.itemsize
+        if not self._is_valid(path, capacity, size):
+            LOGGER.debug("Creating history ring %s", path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                file.truncate(size)
+            header = np.memmap(path, dtype=HEADER_DTYPE, mode="r+", shape=(1,))
+            header[0] = (MAGIC, LAYOUT, capacity, 0, 0)
+            header.flush()
+            del header
+
+        self._header = np.memmap(path, dtype=HEADER_DTYPE, mode="r+", shape=(1,))
+        self._records = np.memmap(
+            path,
+            dtype=RECORD_DTYPE,
+            mode="r+",
+            offset=HEADER_DTYPE.itemsize,
+            shape=(capacity,),
+        )
+        self.capacity = capacity
+
+    @staticmethod
+    def _is_valid(path: str, capacity: int, size: int) -> bool:
+        """Return whether an existing file matches the current layout."""
+        if not os.path.exists(path) or os.path.getsize(path) != size:
+            return False
+        header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)[0]
+        return (
+            header["magic"] == MAGIC
+            and header["layout"] == LAYOUT
+            and header["capacity"] == capacity
+        )
+
+    def __len__(self) -> int:
+        """Return the number of stored records."""
+        return int(self._header[0]["count"])
+
+    @property
+    def last_timestamp(self) -> float | None:
+        """Return the timestamp of the newest record."""
+        if not len(self):
+            return None
+        head = int(self._header[0]["head"])
+        return float(self._records[head - 1]["timestamp"])
+
+    def append(self, timestamp: float, status: dict[str, Any]) -> None:
+        """Write one status frame over the oldest record."""
+        header = self._header[0]
+        head = int(header["head"])
+        record = self._records[head]
+        record["timestamp"] = timestamp
+        mode = status.get("operation_mode")
+        record["operation_mode"] = (
+            OPERATION_MODES.index(mode) if mode in OPERATION_MODES else -1
+        )
+        for field in HISTORY_FIELDS:
+            value = status.get(field)
+            record[field] = np.nan if value is None else float(value)
+
+        header["head"] = (head + 1) % self.capacity
+        header["count"] = min(int(header["count"]) + 1, self.capacity)
+
+    def segments(self) -> tuple[np.ndarray, ...]:
+        """Return the records oldest first as views into the file, without copying.
+
+        The ring wraps, so this is one or two arrays; np.concatenate them when a
+        single contiguous copy is needed.
+        """
+        head = int(self._header[0]["head"])
+        count = len(self)
+        if count < self.capacity:
+            return (self._records[:count],)
+        return (self._records[head:], self._records[:head])
+
+    def close(self) -> None:
+        """Flush pending writes to disk."""
+        self._records.flush()
+        self._header.flush()
+
+
+class HistoryStore:
+    """History rings of all inverters of a config entry, keyed by serial number."""
+
+    def __init__(self, directory: str, capacity: int) -> None:
+        """Initialize the store."""
+        self._directory = directory
+        self._capacity = capacity
+        self.rings: dict[str, HistoryRing] = {}
+
+    def open(self, serial_number: str) -> HistoryRing:
+        """Open the ring of an inverter (blocking)."""
+        if serial_number not in self.rings:
+            name = "".join(c if c.isalnum() else "_" for c in serial_number)
+            path = os.path.join(self._directory, f"{name}.ring")
+            self.rings[serial_number] = HistoryRing(path, self._capacity)
+        return self.rings[serial_number]
+
+    def close(self) -> None:
+        """Flush and forget all rings (blocking)."""
+        for ring in self.rings.values():
+            ring.close()
+        self.rings.clear()
@@ -0,0 +1,112 @@
+"""Prometheus metrics endpoint for Samil Power integration."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.config_entries import ConfigEntryState
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import SamilPowerDataUpdateCoordinator
+
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Per-entry poll counters, rendered from SamilPowerDataUpdateCoordinator.poll_stats
+POLL_FAMILIES = {
+    "samil_poll_total": ("counter", "Number of status polls"),
+    "samil_poll_failures_total": ("counter", "Number of failed status polls"),
+    "samil_poll_duration_seconds": ("gauge", "Duration of the last status poll"),
+    "samil_poll_duration_seconds_total": (
+        "counter",
+        "Total time spent in status polls",
+    ),
+    "samil_rejected_samples_total": (
+        "counter",
+        "Number of implausible status fields rejected",
+    ),
+}
+
+# Status fields that only ever increase, exported as counters so rate() and
+# increase() handle resets, for example after a repair
+COUNTER_FIELDS = ("energy_total", "total_operation_time")
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_families(coordinator: SamilPowerDataUpdateCoordinator) -> dict[str, tuple[str, str, str]]:
+    """Render the latest snapshot of one coordinator.
+
+    Returns a mapping of metric family name to (type, help, sample lines), so
+    samples of several config entries can be merged under one HELP/TYPE header.
+    """
+    entry_label = f'entry="{_escape(coordinator.config_entry.entry_id)}"'
+    client = coordinator.config_entry.runtime_data.client
+    families: dict[str, tuple[str, str, list[str]]] = {}
+
+    def add(name: str, kind: str, help_text: str, labels: str, value) -> None:
+        families.setdefault(name, (kind, help_text, []))[2].append(
+            f"{name}{{{labels}}} {value}"
+        )
+
+    for index, data in coordinator.inverter_data.items():
+        serial = data.get("model", {}).get("serial_number", f"unknown_{index}")
+        labels = f'{entry_label},inverter="{index}",serial="{_escape(serial)}"'
+        add(
+            "samil_up",
+            "gauge",
+            "Whether the inverter answered its last poll or probe",
+            labels,
+            int(client.is_alive(index)),
+        )
+        for field, value in data.get("status", {}).items():
+            if isinstance(value, bool) or not isinstance(value, (int, float, Decimal)):
+                continue
+            kind = "counter" if field in COUNTER_FIELDS else "gauge"
+            add(f"samil_{field}", kind, f"Samil Power inverter {field}", labels, value)
+
+    for name, (kind, help_text) in POLL_FAMILIES.items():
+        add(name, kind, help_text, entry_label, coordinator.poll_stats[name])
+
+    return {
+        name: (kind, help_text, "\n".join(samples))
+        for name, (kind, help_text, samples) in families.items()
+    }
+
+
+class SamilPowerMetricsView(HomeAssistantView):
+    """Serve the cached metrics of all loaded Samil Power entries."""
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the metrics in Prometheus exposition format."""
+        hass = request.app["hass"]
+        merged: dict[str, tuple[str, str, list[str]]] = {}
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            if entry.state is not ConfigEntryState.LOADED:
+                continue
+            for name, (kind, help_text, samples) in entry.runtime_data.coordinator.metrics.items():
+                merged.setdefault(name, (kind, help_text, []))[2].append(samples)
+
+        lines = []
+        for name, (kind, help_text, samples) in merged.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        lines.append("")
+        return web.Response(
+            body="\n".join(lines).encode(),
+            status=HTTPStatus.OK,
+            headers={"Content-Type": CONTENT_TYPE},
+        )
@@ -0,0 +1,152 @@
+"""Staggered polling of the inverters of a Samil Power config entry."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+import zlib
+from typing import TYPE_CHECKING
+
+from .const import LOGGER, PROBE_INTERVAL
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .api import SamilPowerApiClient
+    from .coordinator import SamilPowerDataUpdateCoordinator
+
+
+class StaggeredPoller:
+    """Polls every inverter at its own stable phase within the scan interval.
+
+    Cycles are aligned to wall-clock multiples of the interval. Inside a cycle
+    the inverters of an entry are spread evenly, starting at an offset derived
+    from the entry id, so several entries do not hit the network at the same
+    moment either. The coordinator publishes one snapshot per cycle. Liveness
+    probes run on their own faster cycle with the same phases.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: SamilPowerDataUpdateCoordinator,
+        client: SamilPowerApiClient,
+        interval: float,
+        jitter: float,
+        seed: str,
+    ) -> None:
+        """Initialize the poller."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._client = client
+        self._interval = interval
+        # Maximum random delay added to each poll, in seconds
+        self.jitter = jitter
+        # Stable fraction of the interval where the first inverter is polled
+        self._base_phase = zlib.crc32(seed.encode()) / 2**32
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def interval(self) -> float:
+        """Return the scan interval in seconds."""
+        return self._interval
+
+    def set_interval(self, interval: float) -> None:
+        """Change the scan interval, effective from the next cycle."""
+        self._interval = interval
+
+    def phase(self, index: int, count: int, period: float | None = None) -> float:
+        """Return the offset of an inverter within a cycle in seconds."""
+        if period is None:
+            period = self._interval
+        return ((self._base_phase + index / count) % 1.0) * period
+
+    def start(self) -> None:
+        """Start polling and probing in the background."""
+        if not self._tasks:
+            self._tasks = [
+                self._hass.async_create_background_task(
+                    self._async_run(), "samil_power staggered poller"
+                ),
+                self._hass.async_create_background_task(
+                    self._async_run_probes(), "samil_power staggered prober"
+                ),
+            ]
+
+    def stop(self) -> None:
+        """Stop polling and probing."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+    async def _async_run(self) -> None:
+        """Run poll cycles until stopped."""
+        while True:
+            interval = self._interval
+            cycle_start = (time.time() // interval + 1) * interval
+            await self._async_sleep_until(cycle_start)
+            try:
+                await self._async_poll_cycle(cycle_start, interval)
+            except Exception:  # pylint: disable=broad-except
+                # Like DataUpdateCoordinator, a failed cycle must not stop polling
+                LOGGER.exception("Unexpected error in staggered poll cycle")
+
+    async def _async_poll_cycle(self, cycle_start: float, interval: float) -> None:
+        """Poll every inverter at its phase and publish the snapshot."""
+        if not self._client.connected:
+            # Full rediscovery goes through the coordinator's own refresh
+            await self._coordinator.async_refresh()
+            return
+
+        count = self._client.connected_count
+        # Keep the jitter inside the slot of each inverter
+        jitter = min(self.jitter, interval / count / 2)
+        schedule = sorted(
+            (self.phase(index, count) + random.uniform(0, jitter), index)
+            for index in range(count)
+        )
+
+        start = time.monotonic()
+        data = {}
+        for offset, index in schedule:
+            await self._async_sleep_until(cycle_start + offset)
+            data[index] = await self._client.async_get_inverter_data(index)
+        LOGGER.debug("Staggered poll cycle took %.1f s", time.monotonic() - start)
+
+        await self._coordinator.async_publish(
+            dict(sorted(data.items())), time.monotonic() - start
+        )
+
+    async def _async_run_probes(self) -> None:
+        """Run probe cycles until stopped."""
+        while True:
+            cycle_start = (time.time() // PROBE_INTERVAL + 1) * PROBE_INTERVAL
+            await self._async_sleep_until(cycle_start)
+            try:
+                await self._async_probe_cycle(cycle_start)
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception("Unexpected error in staggered probe cycle")
+
+    async def _async_probe_cycle(self, cycle_start: float) -> None:
+        """Probe every inverter at its phase, then rediscover dropped ones."""
+        if not self._client.connected:
+            return
+
+        count = self._client.connected_count
+        changed = False
+        for offset, index in sorted(
+            (self.phase(index, count, PROBE_INTERVAL), index) for index in range(count)
+        ):
+            await self._async_sleep_until(cycle_start + offset)
+            changed |= await self._client.async_probe_inverter(index, PROBE_INTERVAL)
+        changed |= await self._client.async_rediscover()
+        if changed:
+            self._coordinator.async_update_listeners()
+
+    @staticmethod
+    async def _async_sleep_until(timestamp: float) -> None:
+        """Sleep until a wall-clock timestamp."""
+        delay = timestamp - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -20,14 +20,16 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
+from homeassistant.core import callback
 
-from .const import DOMAIN, LOGGER
-from .entity import SamilPowerEntity
+from .const import LOGGER
+from .entity import SamilPowerEntity, SamilPowerSiteEntity
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .aggregate import SiteAggregate
     from .coordinator import SamilPowerDataUpdateCoordinator
     from .data import SamilPowerConfigEntry
 
@@ -39,6 +41,13 @@ class SamilPowerSensorEntityDescription(SensorEntityDescription):
     value_fn: Optional[callable] = None
 
 
+@dataclass
+class SamilPowerSiteSensorEntityDescription(SensorEntityDescription):
+    """Class describing Samil Power site sensor entities."""
+
+    value_fn: Optional[callable] = None
+
+
 SENSOR_DESCRIPTIONS = (
     # Power sensors
     SamilPowerSensorEntityDescription(
@@ -197,6 +206,55 @@ SENSOR_DESCRIPTIONS = (
 )
 
 
+SITE_SENSOR_DESCRIPTIONS = (
+    SamilPowerSiteSensorEntityDescription(
+        key="output_power",
+        name="Total Output Power",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:solar-power",
+        value_fn=lambda site: site.total("output_power"),
+    ),
+    SamilPowerSiteSensorEntityDescription(
+        key="energy_today",
+        name="Total Energy Today",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:solar-power",
+        value_fn=lambda site: site.total("energy_today"),
+    ),
+    SamilPowerSiteSensorEntityDescription(
+        key="energy_total",
+        name="Total Energy",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:solar-power",
+        value_fn=lambda site: site.total("energy_total"),
+    ),
+    SamilPowerSiteSensorEntityDescription(
+        key="min_temperature",
+        name="Minimum Inverter Temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:thermometer-low",
+        value_fn=lambda site: site.min_temperature,
+    ),
+    SamilPowerSiteSensorEntityDescription(
+        key="max_temperature",
+        name="Maximum Inverter Temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:thermometer-high",
+        value_fn=lambda site: site.max_temperature,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: SamilPowerConfigEntry,
@@ -208,25 +266,65 @@ async def async_setup_entry(
     # Wait for the coordinator to get data at least once
     await coordinator.async_config_entry_first_refresh()
     
-    entities = []
-    
-    # Create entities for each inverter
-    for inverter_index in coordinator.data:
-        LOGGER.debug(
-            "Setting up sensors for inverter %s", inverter_index
-        )
-        
-        # Add all sensor types for this inverter
-        for description in SENSOR_DESCRIPTIONS:
-            entities.append(
-                SamilPowerSensor(
+    # Sensor keys created so far per inverter
+    created: dict[int, set[str]] = {}
+
+    @callback
+    def async_add_new_sensors() -> None:
+        """Add sensors for fields that inverters report but have no entity yet.
+
+        Fields a model never reports, like pv2_* on single-MPPT units, are
+        missing from its status frame and never get an entity. An inverter
+        that is down during setup gets its sensors once it reports. Registry
+        entries from earlier versions are left alone, toggling them would
+        reload the entry.
+        """
+        entities = []
+        site_added = len(created) > 1
+
+        for inverter_index, data in (coordinator.data or {}).items():
+            status = data.get("status")
+            if not status:
+                continue
+            keys = created.setdefault(inverter_index, set())
+            new_descriptions = [
+                description
+                for description in SENSOR_DESCRIPTIONS
+                if description.key not in keys and description.key in status
+            ]
+            if not new_descriptions:
+                continue
+            LOGGER.debug(
+                "Setting up sensors %s for inverter %s",
+                [description.key for description in new_descriptions],
+                inverter_index,
+            )
+            for description in new_descriptions:
+                keys.add(description.key)
+                entities.append(
+                    SamilPowerSensor(
+                        coordinator=coordinator,
+                        entity_description=description,
+                        inverter_index=inverter_index,
+                    )
+                )
+
+        # Site totals only make sense when there is more than one inverter
+        if not site_added and len(created) > 1:
+            entities.extend(
+                SamilPowerSiteSensor(
                     coordinator=coordinator,
                     entity_description=description,
-                    inverter_index=inverter_index,
                 )
+                for description in SITE_SENSOR_DESCRIPTIONS
             )
-    
-    async_add_entities(entities)
+
+        if entities:
+            async_add_entities(entities)
+
+    async_add_new_sensors()
+    # Inverters added through the options are discovered while running
+    entry.async_on_unload(coordinator.async_add_listener(async_add_new_sensors))
 
 
 class SamilPowerSensor(SamilPowerEntity, SensorEntity):
@@ -251,3 +349,29 @@ class SamilPowerSensor(SamilPowerEntity, SensorEntity):
             inverter_data = self.get_inverter_data()
             return self.entity_description.value_fn(inverter_data)
         return None
+
+
+class SamilPowerSiteSensor(SamilPowerSiteEntity, SensorEntity):
+    """Samil Power site total sensor class."""
+
+    entity_description: SamilPowerSiteSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: SamilPowerDataUpdateCoordinator,
+        entity_description: SamilPowerSiteSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, entity_description)
+        self.entity_description = entity_description
+
+    @property
+    def available(self) -> bool:
+        """Return True if at least one inverter reported in the last poll."""
+        return super().available and self.coordinator.site.available_inverters > 0
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        site: SiteAggregate = self.coordinator.site
+        return self.entity_description.value_fn(site)
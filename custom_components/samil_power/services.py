@@ -0,0 +1,103 @@
+"""Services for Samil Power integration."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+    from .coordinator import SamilPowerDataUpdateCoordinator
+
+SERVICE_ANALYZE_PRODUCTION = "analyze_production"
+
+ATTR_DATE = "date"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
+ANALYZE_PRODUCTION_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DATE): cv.date,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+
+@callback
+def async_register_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_analyze_production(call: ServiceCall) -> ServiceResponse:
+        """Compute the production analytics of one day for every inverter."""
+        date = call.data.get(ATTR_DATE) or dt_util.now().date()
+        start = dt_util.start_of_local_day(date).timestamp()
+        end = dt_util.start_of_local_day(date + timedelta(days=1)).timestamp()
+
+        inverters = {}
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            if entry.state is not ConfigEntryState.LOADED:
+                continue
+            entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+            if entry_id and entry.entry_id != entry_id:
+                continue
+            coordinator = entry.runtime_data.coordinator
+            for index, data in coordinator.inverter_data.items():
+                model = data.get("model", {})
+                serial_number = model.get("serial_number", f"unknown_{index}")
+                try:
+                    rated_power = float(model.get("va_rating"))
+                except (TypeError, ValueError):
+                    rated_power = None
+                result = dict(
+                    await hass.async_add_executor_job(
+                        _analyze,
+                        coordinator,
+                        serial_number,
+                        start,
+                        end,
+                        rated_power,
+                    )
+                )
+                if result.get("peak_time") is not None:
+                    result["peak_time"] = dt_util.as_local(
+                        dt_util.utc_from_timestamp(result["peak_time"])
+                    ).isoformat()
+                inverters[serial_number] = result
+
+        return {"date": date.isoformat(), "inverters": inverters}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ANALYZE_PRODUCTION,
+        async_analyze_production,
+        schema=ANALYZE_PRODUCTION_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _analyze(
+    coordinator: SamilPowerDataUpdateCoordinator,
+    serial_number: str,
+    start: float,
+    end: float,
+    rated_power: float | None,
+) -> dict[str, Any]:
+    """Return the cached analytics of one day (runs in executor).
+
+    The ring is opened here, after a restart it is otherwise only opened once
+    the inverter reports, which does not happen at night.
+    """
+    from .analytics import DailyAnalyticsCache
+
+    ring = coordinator.open_history(serial_number)
+    if coordinator.analytics is None:
+        coordinator.analytics = DailyAnalyticsCache()
+    return coordinator.analytics.get(serial_number, ring, start, end, rated_power)
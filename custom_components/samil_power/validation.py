@@ -0,0 +1,233 @@
+"""Rejection of implausible samples before they reach any entity."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Any
+
+# Static plausibility bounds as (min, max)
+BOUNDS = {
+    "grid_voltage": (80, 300),
+    "grid_frequency": (40, 70),
+    "pv1_voltage": (0, 1000),
+    "pv2_voltage": (0, 1000),
+    "pv1_current": (0, 50),
+    "pv2_current": (0, 50),
+    "grid_current": (0, 100),
+    "internal_temperature": (-40, 120),
+    "heatsink_temperature": (-40, 120),
+}
+
+# Power bounds as a multiple of the model's rated power (va_rating)
+RATED_POWER_BOUNDS = {
+    "output_power": 1.2,
+    "pv1_input_power": 1.5,
+    "pv2_input_power": 1.5,
+}
+
+# Counters that never decrease and cannot grow faster than the inverter can
+# produce energy or the clock runs
+COUNTERS = ("energy_total", "total_operation_time")
+
+# Energy counters, which cannot grow faster than the rated power allows
+ENERGY_COUNTERS = ("energy_total", "energy_today")
+
+# Resets to 0 every morning, so only large drops are rejected
+DAILY_COUNTER = "energy_today"
+DAILY_RESET_MAX = 1.0  # kWh
+
+# Fields checked against their rolling median, with the smallest deviation
+# that is never rejected so a perfectly steady signal does not reject noise.
+# PV voltages are left out, they legitimately step with irradiance.
+ROLLING_FIELDS = {
+    "grid_voltage": 10.0,
+    "grid_frequency": 0.5,
+    "internal_temperature": 5.0,
+    "heatsink_temperature": 5.0,
+}
+
+WINDOW_SIZE = 15
+WINDOW_MIN_SAMPLES = 5
+# A window is cleared after a longer pause, three times the longest scan
+# interval, so the first sample after the night is not compared to yesterday
+WINDOW_MAX_GAP = 15 * 60  # seconds
+# Reject beyond this many scaled MADs from the median
+MAD_THRESHOLD = 5.0
+# Scales the MAD to the standard deviation of a normal distribution
+MAD_SCALE = 1.4826
+
+# A field rejected this many polls in a row is accepted again, a value that
+# persists that long is real (for example a counter reset after a repair)
+MAX_CONSECUTIVE_REJECTIONS = WINDOW_SIZE
+
+
+class RollingWindow:
+    """Window of the last WINDOW_SIZE samples, kept sorted as well.
+
+    The window size is fixed, so adding a sample and computing the median or
+    MAD costs the same no matter how long the integration runs.
+    """
+
+    __slots__ = ("_samples", "_sorted", "last_added")
+
+    def __init__(self) -> None:
+        """Initialize an empty window."""
+        self._samples: deque[float] = deque()
+        self._sorted: list[float] = []
+        # Timestamp of the newest sample
+        self.last_added: float | None = None
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    def add(self, value: float, timestamp: float) -> None:
+        """Add a sample, dropping the oldest one when the window is full."""
+        if len(self._samples) == WINDOW_SIZE:
+            oldest = self._samples.popleft()
+            del self._sorted[bisect_left(self._sorted, oldest)]
+        self._samples.append(value)
+        insort(self._sorted, value)
+        self.last_added = timestamp
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._samples.clear()
+        self._sorted.clear()
+        self.last_added = None
+
+    def median(self) -> float:
+        """Return the median of the window."""
+        return _median(self._sorted)
+
+    def mad(self, median: float) -> float:
+        """Return the median absolute deviation from the given median."""
+        return _median(sorted(abs(value - median) for value in self._sorted))
+
+
+def _median(values: list[float]) -> float:
+    """Return the median of a sorted list."""
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2
+
+
+class SampleValidator:
+    """Rejects implausible status fields of the inverters of a config entry.
+
+    Rejected fields are replaced by the last accepted value, or None when
+    there is none yet, so spikes never reach entities, statistics or history.
+    Only accepted values are compared against, a rejected spike never becomes
+    the reference. State is keyed by serial number, indices change on
+    rediscovery. Rolling windows start over after a pause or when the inverter
+    was unavailable, see reset().
+    """
+
+    def __init__(self) -> None:
+        """Initialize the validator."""
+        self._windows: dict[tuple[str, str], RollingWindow] = {}
+        # Last accepted value of each field and when it was accepted
+        self._accepted: dict[str, dict[str, tuple[Any, float]]] = {}
+        self._rejections: dict[tuple[str, str], int] = {}
+
+    def validate(
+        self,
+        serial_number: str,
+        model: dict[str, Any],
+        status: dict[str, Any],
+        timestamp: float,
+    ) -> tuple[dict[str, Any], list[str]]:
+        """Return the filtered status and the names of the rejected fields."""
+        try:
+            rated_power = float(model.get("va_rating"))
+        except (TypeError, ValueError):
+            rated_power = None
+
+        accepted = self._accepted.setdefault(serial_number, {})
+        filtered = {}
+        rejected = []
+        for field, value in status.items():
+            key = (serial_number, field)
+            previous, accepted_at = accepted.get(field, (None, timestamp))
+            hours = (timestamp - accepted_at) / 3600
+            if isinstance(value, str) or self._is_plausible(
+                key, float(value), previous, rated_power, hours, timestamp
+            ) or self._rejections.get(key, 0) >= MAX_CONSECUTIVE_REJECTIONS:
+                filtered[field] = value
+                accepted[field] = (value, timestamp)
+                self._rejections.pop(key, None)
+            else:
+                rejected.append(field)
+                self._rejections[key] = self._rejections.get(key, 0) + 1
+                # Keep the key, a missing field means the model lacks it
+                filtered[field] = previous
+        return filtered, rejected
+
+    def reset(self, serial_number: str) -> None:
+        """Start the rolling windows of an inverter over, call when it is unavailable.
+
+        The accepted values stay, counters are still checked against them.
+        """
+        for (serial, _field), window in self._windows.items():
+            if serial == serial_number:
+                window.clear()
+        for key in [key for key in self._rejections if key[0] == serial_number]:
+            del self._rejections[key]
+
+    def _is_plausible(
+        self,
+        key: tuple[str, str],
+        value: float,
+        previous: Any,
+        rated_power: float | None,
+        hours: float,
+        timestamp: float,
+    ) -> bool:
+        """Run the bounds, counter and rolling median checks for one field."""
+        field = key[1]
+        if field in BOUNDS:
+            low, high = BOUNDS[field]
+            if not low <= value <= high:
+                return False
+
+        if field in RATED_POWER_BOUNDS and rated_power:
+            if not 0 <= value <= RATED_POWER_BOUNDS[field] * rated_power:
+                return False
+
+        if field in COUNTERS and previous is not None:
+            increase = value - float(previous)
+            if increase < 0:
+                return False
+            if field == "total_operation_time" and increase > hours + 1:
+                return False
+
+        if field == DAILY_COUNTER and previous is not None:
+            if value < float(previous) and value > DAILY_RESET_MAX:
+                return False
+
+        if field in ENERGY_COUNTERS and previous is not None and rated_power:
+            # Generous: twice the rated power since the last accepted value
+            # plus one register step
+            if value - float(previous) > 2 * rated_power / 1000 * hours + 0.1:
+                return False
+
+        if field in ROLLING_FIELDS:
+            window = self._windows.setdefault(key, RollingWindow())
+            if window.last_added is not None and timestamp - window.last_added > WINDOW_MAX_GAP:
+                window.clear()
+            plausible = True
+            if len(window) >= WINDOW_MIN_SAMPLES:
+                median = window.median()
+                allowed = max(
+                    MAD_THRESHOLD * MAD_SCALE * window.mad(median),
+                    ROLLING_FIELDS[field],
+                )
+                plausible = abs(value - median) <= allowed
+            # Rejected samples still enter the window, so a lasting level
+            # shift is accepted once it makes up half of the window
+            window.add(value, timestamp)
+            return plausible
+
+        return True
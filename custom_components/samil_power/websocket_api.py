@@ -0,0 +1,156 @@
+"""Websocket API for Samil Power integration."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN, SIGNAL_ENTRY_UNLOADED
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import SamilPowerDataUpdateCoordinator
+    from .data import SamilPowerConfigEntry
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_snapshot)
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+def _snapshot(coordinator: SamilPowerDataUpdateCoordinator) -> dict[str, Any]:
+    """Return the latest data of all inverters of an entry in JSON-able form."""
+    client = coordinator.config_entry.runtime_data.client
+    return {
+        str(index): {
+            "model": dict(data.get("model", {})),
+            "status": {
+                field: float(value) if isinstance(value, Decimal) else value
+                for field, value in data.get("status", {}).items()
+            },
+            "alive": client.is_alive(index),
+        }
+        for index, data in coordinator.inverter_data.items()
+    }
+
+
+def _delta(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Return the status fields and liveness that changed between snapshots.
+
+    Fields that disappeared are sent as None, model info is left out since it
+    does not change while connected.
+    """
+    delta = {}
+    for index, inverter in new.items():
+        previous = old.get(index, {})
+        old_status = previous.get("status", {})
+        new_status = inverter["status"]
+        changed = {
+            field: value
+            for field, value in new_status.items()
+            if old_status.get(field) != value
+        }
+        changed.update(
+            (field, None) for field in old_status if field not in new_status
+        )
+        if changed or previous.get("alive") != inverter["alive"]:
+            delta[index] = {"status": changed, "alive": inverter["alive"]}
+    for index in old.keys() - new.keys():
+        delta[index] = None
+    return delta
+
+
+def _get_entry(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> SamilPowerConfigEntry | None:
+    """Return the requested loaded entry or send an error."""
+    entry = hass.config_entries.async_get_entry(msg["entry_id"])
+    if entry is None or entry.domain != DOMAIN or entry.state is not ConfigEntryState.LOADED:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry not found"
+        )
+        return None
+    return entry
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/snapshot",
+        vol.Required("entry_id"): str,
+    }
+)
+@callback
+def websocket_snapshot(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the full snapshot of all inverters of an entry."""
+    if (entry := _get_entry(hass, connection, msg)) is None:
+        return
+    connection.send_result(msg["id"], _snapshot(entry.runtime_data.coordinator))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Required("entry_id"): str,
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Send the full snapshot, then the changed fields after every poll.
+
+    The subscription ends with an unloaded event when the entry unloads, for
+    example on a reload, the client then subscribes again.
+    """
+    if (entry := _get_entry(hass, connection, msg)) is None:
+        return
+
+    coordinator = entry.runtime_data.coordinator
+    last = _snapshot(coordinator)
+
+    @callback
+    def async_forward_delta() -> None:
+        """Send what changed since the last message."""
+        nonlocal last
+        current = _snapshot(coordinator)
+        if delta := _delta(last, current):
+            connection.send_message(
+                websocket_api.event_message(msg["id"], {"delta": delta})
+            )
+        last = current
+
+    @callback
+    def async_entry_unloaded() -> None:
+        """End the subscription, its coordinator is gone."""
+        connection.subscriptions.pop(msg["id"])()
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"unloaded": True})
+        )
+
+    remove_listener = coordinator.async_add_listener(async_forward_delta)
+    remove_dispatcher = async_dispatcher_connect(
+        hass, SIGNAL_ENTRY_UNLOADED.format(entry.entry_id), async_entry_unloaded
+    )
+
+    @callback
+    def async_unsubscribe() -> None:
+        """Stop forwarding deltas and listening for the unload."""
+        remove_listener()
+        remove_dispatcher()
+
+    connection.subscriptions[msg["id"]] = async_unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(msg["id"], {"snapshot": last})
+    )
@@ -0,0 +1,114 @@
+"""Tests for the site aggregate."""
+
+from decimal import Decimal
+
+from custom_components.samil_power.aggregate import SiteAggregate
+
+
+def _status(power, today, total, temperature=40):
+    return {
+        "output_power": power,
+        "energy_today": Decimal(today),
+        "energy_total": Decimal(total),
+        "internal_temperature": Decimal(temperature),
+    }
+
+
+def test_sums_inverters():
+    site = SiteAggregate()
+    site.update("A", _status(500, "10", "1000", 30))
+    site.update("B", _status(300, "12", "2000", 45))
+
+    assert site.total("output_power") == 800
+    assert site.total("energy_today") == Decimal("22")
+    assert site.total("energy_total") == Decimal("3000")
+    assert site.available_inverters == 2
+    assert site.min_temperature == 30
+    assert site.max_temperature == 45
+
+
+def test_update_replaces_contribution():
+    site = SiteAggregate()
+    site.update("A", _status(500, "10", "1000"))
+    site.update("A", _status(200, "11", "1001"))
+
+    assert site.total("output_power") == 200
+    assert site.total("energy_today") == Decimal("11")
+    assert site.total("energy_total") == Decimal("1001")
+
+
+def test_unavailable_inverter_keeps_energy():
+    site = SiteAggregate()
+    site.update("A", _status(500, "10", "1000", 30))
+    site.update("B", _status(300, "12", "2000", 45))
+    site.update("A", None)
+
+    # Counters must not drop, the recorder would read a meter reset
+    assert site.total("energy_today") == Decimal("22")
+    assert site.total("energy_total") == Decimal("3000")
+    assert site.total("output_power") == 300
+    assert site.available_inverters == 1
+    assert site.min_temperature == site.max_temperature == 45
+
+
+def test_reset_daily_clears_unavailable_inverters():
+    site = SiteAggregate()
+    site.update("A", _status(0, "10", "1000"))
+    site.update("B", _status(300, "12", "2000"))
+    site.update("A", None)
+    site.reset_daily()
+
+    assert site.total("energy_today") == Decimal("12")
+    assert site.total("energy_total") == Decimal("3000")
+
+    site.update("A", _status(100, "0.1", "1000"))
+    assert site.total("energy_today") == Decimal("12.1")
+
+
+def test_counter_unknown_until_every_inverter_reported():
+    site = SiteAggregate()
+    site.update("A", _status(500, "10", "1000"))
+    site.update("B", None)
+
+    assert site.total("energy_total") is None
+    assert site.total("energy_today") is None
+    assert site.total("output_power") == 500
+
+    site.update("B", _status(300, "12", "2000"))
+    assert site.total("energy_total") == Decimal("3000")
+
+
+def test_missing_counter_field_keeps_last_value():
+    site = SiteAggregate()
+    site.update("A", _status(500, "10", "1000"))
+    site.update("A", {"output_power": 400, "energy_today": None, "energy_total": None})
+
+    assert site.total("energy_today") == Decimal("10")
+    assert site.total("energy_total") == Decimal("1000")
+    assert site.total("output_power") == 400
+
+
+def test_keyed_by_serial_number():
+    site = SiteAggregate()
+    site.update("A", _status(500, "10", "1000"))
+    site.update("B", _status(300, "12", "2000"))
+    # After a rediscovery B reports alone, A is marked unavailable
+    site.update("B", _status(310, "12", "2000"))
+    site.update("A", None)
+
+    assert site.total("energy_total") == Decimal("3000")
+    assert site.total("output_power") == 310
+    assert site.available_inverters == 1
+
+
+def test_remove():
+    site = SiteAggregate()
+    site.update("A", _status(500, "10", "1000", 30))
+    site.update("B", None)
+    site.remove("B")
+
+    assert site.inverters == {"A"}
+    assert site.total("energy_total") == Decimal("1000")
+    site.remove("A")
+    assert site.total("energy_total") is None
+    assert site.min_temperature is None
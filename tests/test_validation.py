@@ -0,0 +1,110 @@
+"""Tests for the sample validator."""
+
+from decimal import Decimal
+
+from custom_components.samil_power.validation import (
+    MAX_CONSECUTIVE_REJECTIONS,
+    SampleValidator,
+)
+
+MODEL = {"serial_number": "S1", "va_rating": "3000"}
+INTERVAL = 30
+
+
+def _feed(validator, field, values, start=0.0):
+    """Validate one value per poll, return the filtered values and rejections."""
+    results = []
+    for i, value in enumerate(values):
+        status, rejected = validator.validate(
+            "S1", MODEL, {field: value}, start + i * INTERVAL
+        )
+        results.append((status[field], field in rejected))
+    return results
+
+
+def test_spike_is_rejected():
+    validator = SampleValidator()
+    results = _feed(validator, "grid_frequency", [Decimal("50.0")] * 10 + [Decimal("65.0"), Decimal("50.1")])
+
+    assert results[10] == (Decimal("50.0"), True)
+    assert results[11] == (Decimal("50.1"), False)
+
+
+def test_out_of_bounds_first_value_is_none():
+    validator = SampleValidator()
+    status, rejected = validator.validate(
+        "S1", MODEL, {"grid_frequency": 0, "grid_voltage": 230}, 0
+    )
+
+    assert status == {"grid_frequency": None, "grid_voltage": 230}
+    assert rejected == ["grid_frequency"]
+
+
+def test_decreasing_energy_total_is_rejected():
+    validator = SampleValidator()
+    results = _feed(
+        validator, "energy_total", [Decimal("1000.0"), Decimal("999.0"), Decimal("1000.1")]
+    )
+
+    assert results[1] == (Decimal("1000.0"), True)
+    assert results[2] == (Decimal("1000.1"), False)
+
+
+def test_energy_today_spike_does_not_become_reference():
+    validator = SampleValidator()
+    results = _feed(
+        validator,
+        "energy_today",
+        [Decimal("1.00"), Decimal("1.05"), Decimal("655.35"), Decimal("1.10")],
+    )
+
+    assert results[2] == (Decimal("1.05"), True)
+    assert results[3] == (Decimal("1.10"), False)
+
+
+def test_energy_today_daily_reset_is_accepted():
+    validator = SampleValidator()
+    results = _feed(validator, "energy_today", [Decimal("12.0"), Decimal("0.0")])
+    assert results[1] == (Decimal("0.0"), False)
+
+    validator = SampleValidator()
+    results = _feed(validator, "energy_today", [Decimal("12.0"), Decimal("5.0")])
+    assert results[1] == (Decimal("12.0"), True)
+
+
+def test_pv_voltage_step_is_accepted():
+    validator = SampleValidator()
+    results = _feed(validator, "pv1_voltage", [0] * 10 + [300])
+
+    assert results[-1] == (300, False)
+
+
+def test_dawn_gap_clears_window():
+    validator = SampleValidator()
+    _feed(validator, "internal_temperature", [Decimal("45.2")] * 10)
+    # Next sample after a night without polls
+    results = _feed(
+        validator, "internal_temperature", [Decimal("12.0")], start=10 * 3600
+    )
+
+    assert results == [(Decimal("12.0"), False)]
+
+
+def test_reset_after_unavailable_clears_window():
+    validator = SampleValidator()
+    _feed(validator, "internal_temperature", [Decimal("45.2")] * 10)
+    validator.reset("S1")
+    results = _feed(
+        validator, "internal_temperature", [Decimal("12.0")], start=10 * INTERVAL
+    )
+
+    assert results == [(Decimal("12.0"), False)]
+
+
+def test_persistent_value_is_accepted_eventually():
+    validator = SampleValidator()
+    values = [Decimal("1000.0")] + [Decimal("10.0")] * (MAX_CONSECUTIVE_REJECTIONS + 1)
+    results = _feed(validator, "energy_total", values)
+
+    assert all(rejected for _, rejected in results[1:-1])
+    assert results[-1] == (Decimal("10.0"), False)